@@ -1,3 +1,4 @@
+from typing import Any, Callable, Dict, List, Tuple, Type
 from disnake import ApplicationCommandInteraction
 from disnake.ext.commands import errors
 from utils.logger import get_logger
@@ -7,6 +8,9 @@ import disnake
 
 logger = get_logger()
 
+# Shared by every error embed; Color.red() would otherwise allocate a new Color each time
+_RED = disnake.Color.red()
+
 
 class ErrorEmbed:
     """
@@ -25,15 +29,298 @@ class ErrorEmbed:
         Returns:
             disnake.Embed: The error embed.
         """
+        if additional_info:
+            description = f"**Error:**\n{error}\n\n**Additional info:**\n{additional_info}"
+        else:
+            description = f"**Error:**\n{error}\n\n"
         embed = disnake.Embed(
             title="__An error occurred__",
-            description="**Error:**\n" + error + "\n\n" +
-                        ("**Additional info:**\n" + additional_info if additional_info else ""),
-            color=disnake.Color.red()
+            description=description,
+            color=_RED
         )
         return embed
 
 
+def _prettify_permission(permission: str) -> str:
+    """
+    Converts a permission name for display, e.g. `manage_guild` -> `Manage Server`.
+
+    Args:
+        permission (str): The raw permission name.
+
+    Returns:
+        str: The human-readable permission name.
+    """
+    return permission.replace("_", " ").replace("guild", "server").title()
+
+
+# Discord's permission names are a fixed set, so format them all once up front
+_PERM_PRETTY: Dict[str, str] = {
+    perm: _prettify_permission(perm) for perm in disnake.Permissions.VALID_FLAGS
+}
+
+
+def _format_permissions(permissions: List[str]) -> str:
+    """
+    Formats permission names for display.
+
+    Args:
+        permissions (List[str]): The raw permission names.
+
+    Returns:
+        str: The comma-separated, human-readable permission names.
+    """
+    return ", ".join(
+        f"`{_PERM_PRETTY.get(perm) or _prettify_permission(perm)}`" for perm in permissions
+    )
+
+
+# Errors whose message never depends on the error instance. Their embeds are
+# built once at import and reused for every occurrence.
+_STATIC_ERRORS: Dict[Type[errors.CommandError], Tuple[str, str]] = {
+    errors.TooManyArguments: (
+        "Too many arguments",
+        "You have provided too many arguments for this command."
+    ),
+    errors.BadArgument: (
+        "Bad argument",
+        "One or more arguments provided are invalid."
+    ),
+    errors.CheckFailure: (
+        "Check failure",
+        "You do not have permission to run this command."
+    ),
+    errors.CommandNotFound: (
+        "Command not found",
+        "The command you tried to invoke does not exist."
+    ),
+    errors.DisabledCommand: (
+        "Disabled command",
+        "This command is currently disabled."
+    ),
+    errors.UserInputError: (
+        "User input error",
+        "There was a problem with your input. Please check your command and try again."
+    ),
+    errors.NSFWChannelRequired: (
+        "NSFW channel required",
+        "This command can only be used in NSFW channels."
+    ),
+    errors.BadUnionArgument: (
+        "Bad union argument",
+        "The argument could not be converted to any of the expected types."
+    ),
+    errors.BadLiteralArgument: (
+        "Bad literal argument",
+        "The argument did not match any of the expected literal values."
+    ),
+    errors.ArgumentParsingError: (
+        "Argument parsing error",
+        "There was an issue while parsing your input."
+    ),
+    errors.FlagError: (
+        "Flag error",
+        "There was an issue with parsing flags."
+    ),
+    errors.PrivateMessageOnly: (
+        "Private message only",
+        "This command can only be used in a private message."
+    ),
+    errors.NoPrivateMessage: (
+        "No private message",
+        "This command cannot be used in a private message."
+    ),
+    errors.NotOwner: (
+        "Not owner",
+        "You are not the owner of this bot."
+    ),
+}
+
+# Maps each remaining error type to a callable building its (title, additional info) pair
+# from the error instance, so handling it is a single lookup plus one format.
+_DYNAMIC_HANDLERS: Dict[Type[errors.CommandError], Callable[[Any], Tuple[str, str]]] = {
+    errors.ExpectedClosingQuoteError: lambda e: (
+        "Expected closing quote",
+        f"Closing quote: {e.close_quote}"
+    ),
+    errors.ConversionError: lambda e: (
+        "Conversion error",
+        f"Failed to convert argument: {e.converter}\nOriginal Exception: {e.original}"
+    ),
+    errors.MissingRequiredArgument: lambda e: (
+        "Missing required argument",
+        f"The argument `{e.param.name}` is required but was not provided."
+    ),
+    errors.CommandInvokeError: lambda e: (
+        "Command invocation error",
+        f"The command raised an error: {e.original}"
+    ),
+    errors.CommandOnCooldown: lambda e: (
+        "Command on cooldown",
+        f"You need to wait `{e.retry_after:.2f}` seconds before using this command again."
+    ),
+    errors.MaxConcurrencyReached: lambda e: (
+        "Max concurrency reached",
+        f"This command is currently being used by too many users ({e.number}). Please try again later."
+    ),
+    errors.ObjectNotFound: lambda e: (
+        "Object not found",
+        f"The specified object could not be found. Object: `{e.argument}`"
+    ),
+    errors.MemberNotFound: lambda e: (
+        "Member not found",
+        f"The specified member `{e.argument}` could not be found."
+    ),
+    errors.GuildNotFound: lambda e: (
+        "Guild not found",
+        f"The specified guild `{e.argument}` could not be found."
+    ),
+    errors.UserNotFound: lambda e: (
+        "User not found",
+        f"The specified user `{e.argument}` could not be found."
+    ),
+    errors.ChannelNotFound: lambda e: (
+        "Channel not found",
+        f"The specified channel `{e.argument}` could not be found."
+    ),
+    errors.ThreadNotFound: lambda e: (
+        "Thread not found",
+        f"The specified thread `{e.argument}` could not be found."
+    ),
+    errors.ChannelNotReadable: lambda e: (
+        "Channel not readable",
+        f"The bot cannot read messages in `{e.argument.mention}` (`{e.argument.id}`)."
+    ),
+    errors.BadColourArgument: lambda e: (
+        "Bad color argument",
+        f"The specified color `{e.argument}` is not valid."
+    ),
+    errors.RoleNotFound: lambda e: (
+        "Role not found",
+        f"The specified role `{e.argument}` could not be found."
+    ),
+    errors.BadInviteArgument: lambda e: (
+        "Invalid invite",
+        f"The specified invite link `{e.argument}` is invalid or expired."
+    ),
+    errors.EmojiNotFound: lambda e: (
+        "Emoji not found",
+        f"The specified emoji `{e.argument}` could not be found."
+    ),
+    errors.GuildStickerNotFound: lambda e: (
+        "Sticker not found",
+        f"The specified sticker `{e.argument}` could not be found."
+    ),
+    errors.GuildScheduledEventNotFound: lambda e: (
+        "Scheduled event not found",
+        f"The specified scheduled event `{e.argument}` could not be found."
+    ),
+    errors.PartialEmojiConversionFailure: lambda e: (
+        "Partial emoji conversion failure",
+        f"The specified emoji `{e.argument}` could not be converted."
+    ),
+    errors.BadBoolArgument: lambda e: (
+        "Bad boolean argument",
+        f"The specified boolean argument `{e.argument}` is not recognized."
+    ),
+    errors.LargeIntConversionFailure: lambda e: (
+        "Large integer conversion failure",
+        f"The specified argument `{e.argument}` could not be converted to an integer."
+    ),
+    errors.MissingRole: lambda e: (
+        "Missing role",
+        f"You are missing `{e.missing_role!r}` to run this command."
+    ),
+    errors.BotMissingRole: lambda e: (
+        "Bot missing role",
+        f"The bot is missing `{e.missing_role!r}` to run this command."
+    ),
+    errors.MissingAnyRole: lambda e: (
+        "Missing any role",
+        f"You are missing at least one of these roles to run this command: {', '.join(e.missing_roles)}"
+    ),
+    errors.BotMissingAnyRole: lambda e: (
+        "Bot missing any role",
+        f"The bot is missing at least one of these roles to run this command: {', '.join(e.missing_roles)}"
+    ),
+    errors.MissingPermissions: lambda e: (
+        "Missing permissions",
+        f"You are missing {_format_permissions(e.missing_permissions)} permission(s) to run this command."
+    ),
+    errors.BotMissingPermissions: lambda e: (
+        "Bot missing permissions",
+        f"The bot is missing {_format_permissions(e.missing_permissions)} permission(s) to run this command."
+    ),
+    errors.UnexpectedQuoteError: lambda e: (
+        "Unexpected quote error",
+        f"Unexpected quote mark: {e.quote!r} found in input."
+    ),
+    errors.InvalidEndOfQuotedStringError: lambda e: (
+        "Invalid end of quoted string",
+        f"Expected space after closing quote but received: {e.char!r}."
+    ),
+    errors.ExtensionError: lambda e: (
+        "Extension error",
+        f"An error occurred with an extension: {e.name}."
+    ),
+    errors.ExtensionAlreadyLoaded: lambda e: (
+        "Extension already loaded",
+        f"The extension `{e.name}` is already loaded."
+    ),
+    errors.ExtensionNotLoaded: lambda e: (
+        "Extension not loaded",
+        f"The extension `{e.name}` has not been loaded."
+    ),
+    errors.NoEntryPointError: lambda e: (
+        "No entry point error",
+        f"The extension `{e.name}` has no 'setup' function."
+    ),
+    errors.ExtensionFailed: lambda e: (
+        "Extension failed",
+        f"The extension `{e.name}` failed to load: {e.original}"
+    ),
+    errors.ExtensionNotFound: lambda e: (
+        "Extension not found",
+        f"The extension `{e.name}` could not be found."
+    ),
+    errors.CommandRegistrationError: lambda e: (
+        "Command registration error",
+        f"The command `{e.name}` is already an existing command or alias."
+    ),
+    errors.TooManyFlags: lambda e: (
+        "Too many flags",
+        f"Flag `{e.flag.name}` received too many values. Expected {e.flag.max_args} but received {len(e.values)}."
+    ),
+    errors.BadFlagArgument: lambda e: (
+        "Bad flag argument",
+        f"Could not convert to `{e.flag.annotation.__name__}` for flag `{e.flag.name}`."
+    ),
+    errors.MissingRequiredFlag: lambda e: (
+        "Missing required flag",
+        f"Flag `{e.flag.name}` is required and missing."
+    ),
+    errors.MissingFlagArgument: lambda e: (
+        "Missing flag argument",
+        f"Flag `{e.flag.name}` does not have an argument."
+    ),
+    errors.MessageNotFound: lambda e: (
+        "Message not found",
+        f"The specified message `{e.argument}` could not be found."
+    ),
+}
+
+# CheckAnyFailure shares the CheckFailure entry
+_STATIC_ERRORS[errors.CheckAnyFailure] = _STATIC_ERRORS[errors.CheckFailure]
+
+# Default error handling if no specific error handling is defined
+_DEFAULT_ERROR = ("Unknown error", "An unexpected error occurred. Please try again later.")
+
+_STATIC_EMBEDS: Dict[Type[errors.CommandError], disnake.Embed] = {
+    error_type: ErrorEmbed.create_error_embed(*message) for error_type, message in _STATIC_ERRORS.items()
+}
+_DEFAULT_EMBED = ErrorEmbed.create_error_embed(*_DEFAULT_ERROR)
+
+
 class Bot(commands.InteractionBot):
     """
     Custom bot class that extends disnake's InteractionBot with additional functionality.
@@ -50,15 +337,22 @@ class Bot(commands.InteractionBot):
         super().__init__(*args, **kwargs)
         self.cog_manager = CogManager(self)
         self.config_manager = ConfigManager(self)
-
+        self._cogs_loaded = False
 
     async def on_ready(self) -> None:
-        """Called when the bot connects to Discord's API."""
-        logger.info(f"Logged in as {self.user}")
+        """
+        Called when the bot connects to Discord's API.
+
+        This may fire more than once (e.g. after a reconnect), so cogs are only loaded the first time.
+        """
+        logger.info("Logged in as %s", self.user)
+        if self._cogs_loaded:
+            return
+        self._cogs_loaded = True
         cogs, loading_errors = self.cog_manager.load_cogs()
-        logger.info(f"Loaded cogs: {cogs}")
+        logger.info("Loaded cogs: %s", cogs)
         if loading_errors:
-            logger.error(f"Failed to load cogs: {loading_errors}")
+            logger.error("Failed to load cogs: %s", loading_errors)
 
     async def on_slash_command_error(
             self, interaction: ApplicationCommandInteraction, error: errors.CommandError
@@ -70,7 +364,7 @@ class Bot(commands.InteractionBot):
             interaction (ApplicationCommandInteraction): The interaction that triggered the command.
             error (errors.CommandError): The error that occurred.
         """
-        logger.error(f"Error occurred in command '{interaction.data.get('name')}': {error}")
+        logger.error("Error occurred in command '%s': %s", interaction.data.get("name"), error)
 
         # Create an error embed based on the specific error type
         embed = self._get_error_embed(error)
@@ -84,254 +378,22 @@ class Bot(commands.InteractionBot):
             error (errors.CommandError): The error that occurred.
 
         Returns:
-            disnake.Embed: The generated error embed.
+            disnake.Embed: The generated error embed. Embeds for errors with constant text
+            (and the unknown-error fallback) are shared module-level instances and must not
+            be mutated; copy them first (e.g. with `embed.copy()`) before adding fields or footers.
         """
-        error_map = {
-            errors.ExpectedClosingQuoteError: (
-                "Expected closing quote",
-                f"Closing quote: {error.close_quote}"
-            ),
-            errors.ConversionError: (
-                "Conversion error",
-                f"Failed to convert argument: {error.converter}\nOriginal Exception: {error.original}"
-            ),
-            errors.MissingRequiredArgument: (
-                "Missing required argument",
-                f"The argument `{error.param.name}` is required but was not provided."
-            ),
-            errors.TooManyArguments: (
-                "Too many arguments",
-                "You have provided too many arguments for this command."
-            ),
-            errors.BadArgument: (
-                "Bad argument",
-                "One or more arguments provided are invalid."
-            ),
-            errors.CheckFailure: (
-                "Check failure",
-                "You do not have permission to run this command."
-            ),
-            errors.CommandNotFound: (
-                "Command not found",
-                "The command you tried to invoke does not exist."
-            ),
-            errors.DisabledCommand: (
-                "Disabled command",
-                "This command is currently disabled."
-            ),
-            errors.CommandInvokeError: (
-                "Command invocation error",
-                f"The command raised an error: {error.original}"
-            ),
-            errors.CommandOnCooldown: (
-                "Command on cooldown",
-                f"You need to wait `{error.retry_after:.2f}` seconds before using this command again."
-            ),
-            errors.MaxConcurrencyReached: (
-                "Max concurrency reached",
-                f"This command is currently being used by too many users ({error.number}). Please try again later."
-            ),
-            errors.UserInputError: (
-                "User input error",
-                "There was a problem with your input. Please check your command and try again."
-            ),
-            errors.ObjectNotFound: (
-                "Object not found",
-                f"The specified object could not be found. Object: `{error.argument}`"
-            ),
-            errors.MemberNotFound: (
-                "Member not found",
-                f"The specified member `{error.argument}` could not be found."
-            ),
-            errors.GuildNotFound: (
-                "Guild not found",
-                f"The specified guild `{error.argument}` could not be found."
-            ),
-            errors.UserNotFound: (
-                "User not found",
-                f"The specified user `{error.argument}` could not be found."
-            ),
-            errors.ChannelNotFound: (
-                "Channel not found",
-                f"The specified channel `{error.argument}` could not be found."
-            ),
-            errors.ThreadNotFound: (
-                "Thread not found",
-                f"The specified thread `{error.argument}` could not be found."
-            ),
-            errors.ChannelNotReadable: (
-                "Channel not readable",
-                f"The bot cannot read messages in `{error.argument.mention}` (`{error.argument.id}`)."
-            ),
-            errors.BadColourArgument: (
-                "Invalid color argument",
-                f"The specified color `{error.argument}` is not valid."
-            ),
-            errors.RoleNotFound: (
-                "Role not found",
-                f"The specified role `{error.argument}` could not be found."
-            ),
-            errors.BadInviteArgument: (
-                "Invalid invite",
-                f"The specified invite link `{error.argument}` is invalid or expired."
-            ),
-            errors.EmojiNotFound: (
-                "Emoji not found",
-                f"The specified emoji `{error.argument}` could not be found."
-            ),
-            errors.GuildStickerNotFound: (
-                "Sticker not found",
-                f"The specified sticker `{error.argument}` could not be found."
-            ),
-            errors.GuildScheduledEventNotFound: (
-                "Scheduled event not found",
-                f"The specified scheduled event `{error.argument}` could not be found."
-            ),
-            errors.PartialEmojiConversionFailure: (
-                "Partial emoji conversion failure",
-                f"The specified emoji `{error.argument}` could not be converted."
-            ),
-            errors.BadBoolArgument: (
-                "Bad boolean argument",
-                f"The specified boolean argument `{error.argument}` is not recognized."
-            ),
-            errors.LargeIntConversionFailure: (
-                "Large integer conversion failure",
-                f"The specified argument `{error.argument}` could not be converted to an integer."
-            ),
-            errors.DisabledCommand: (
-                "Disabled command",
-                "This command is currently disabled."
-            ),
-            errors.MissingRole: (
-                "Missing role",
-                f"You are missing `{error.missing_role!r}` to run this command."
-            ),
-            errors.BotMissingRole: (
-                "Bot missing role",
-                f"The bot is missing `{error.missing_role!r}` to run this command."
-            ),
-            errors.MissingAnyRole: (
-                "Missing any role",
-                f"You are missing at least one of these roles to run this command: {', '.join(error.missing_roles)}"
-            ),
-            errors.BotMissingAnyRole: (
-                "Bot missing any role",
-                f"The bot is missing at least one of these roles to run this command: {', '.join(error.missing_roles)}"
-            ),
-            errors.MissingPermissions: (
-                "Missing permissions",
-                f"You are missing {', '.join([f'`{perm.replace("_", " ").replace("guild", "server").title()}`' for perm in error.missing_permissions])} permission(s) to run this command."
-            ),
-            errors.BotMissingPermissions: (
-                "Bot missing permissions",
-                f"The bot is missing {', '.join([f'`{perm.replace("_", " ").replace("guild", "server").title()}`' for perm in error.missing_permissions])} permission(s) to run this command."
-            ),
-            errors.NSFWChannelRequired: (
-                "NSFW channel required",
-                "This command can only be used in NSFW channels."
-            ),
-            errors.BadUnionArgument: (
-                "Bad union argument",
-                "The argument could not be converted to any of the expected types."
-            ),
-            errors.BadLiteralArgument: (
-                "Bad literal argument",
-                "The argument did not match any of the expected literal values."
-            ),
-            errors.ArgumentParsingError: (
-                "Argument parsing error",
-                "There was an issue while parsing your input."
-            ),
-            errors.UnexpectedQuoteError: (
-                "Unexpected quote error",
-                f"Unexpected quote mark: {error.quote!r} found in input."
-            ),
-            errors.InvalidEndOfQuotedStringError: (
-                "Invalid end of quoted string",
-                f"Expected space after closing quote but received: {error.char!r}."
-            ),
-            errors.ExtensionError: (
-                "Extension error",
-                f"An error occurred with an extension: {error.name}."
-            ),
-            errors.ExtensionAlreadyLoaded: (
-                "Extension already loaded",
-                f"The extension `{error.name}` is already loaded."
-            ),
-            errors.ExtensionNotLoaded: (
-                "Extension not loaded",
-                f"The extension `{error.name}` has not been loaded."
-            ),
-            errors.NoEntryPointError: (
-                "No entry point error",
-                f"The extension `{error.name}` has no 'setup' function."
-            ),
-            errors.ExtensionFailed: (
-                "Extension failed",
-                f"The extension `{error.name}` failed to load: {error.original}"
-            ),
-            errors.ExtensionNotFound: (
-                "Extension not found",
-                f"The extension `{error.name}` could not be found."
-            ),
-            errors.CommandRegistrationError: (
-                "Command registration error",
-                f"The command `{error.name}` is already an existing command or alias."
-            ),
-            errors.FlagError: (
-                "Flag error",
-                "There was an issue with parsing flags."
-            ),
-            errors.TooManyFlags: (
-                "Too many flags",
-                f"Flag `{error.flag.name}` received too many values. Expected {error.flag.max_args} but received {len(error.values)}."
-            ),
-            errors.BadFlagArgument: (
-                "Bad flag argument",
-                f"Could not convert to `{error.flag.annotation.__name__}` for flag `{error.flag.name}`."
-            ),
-            errors.MissingRequiredFlag: (
-                "Missing required flag",
-                f"Flag `{error.flag.name}` is required and missing."
-            ),
-            errors.MissingFlagArgument: (
-                "Missing flag argument",
-                f"Flag `{error.flag.name}` does not have an argument."
-            ),
-            errors.PrivateMessageOnly: (
-                "Private message only",
-                "This command can only be used in a private message."
-            ),
-            errors.NoPrivateMessage: (
-                "No private message",
-                "This command cannot be used in a private message."
-            ),
-            errors.NotOwner: (
-                "Not owner",
-                "You are not the owner of this bot."
-            ),
-            errors.CheckAnyFailure: (
-                "Check Failed",
-                "You do not have permission to run this command."
-            ),
-            errors.MessageNotFound: (
-                "Message not found",
-                f"The specified message `{error.argument}` could not be found."
-            ),
-            errors.BadColorArgument: (
-                "Bad color argument",
-                f"The specified color `{error.argument}` is not valid."
-            )
-        }
-
-        # Default error handling if no specific error handling is defined
-        default_error = ("Unknown error", "An unexpected error occurred. Please try again later.")
+        error_type = type(error)
+
+        # Errors with constant text reuse their prebuilt embed
+        embed = _STATIC_EMBEDS.get(error_type)
+        if embed is not None:
+            return embed
 
         # Get the embed based on the error type, or use the default if not found
-        return ErrorEmbed.create_error_embed(
-            *error_map.get(type(error), default_error)
-        )
+        handler = _DYNAMIC_HANDLERS.get(error_type)
+        if handler is None:
+            return _DEFAULT_EMBED
+        return ErrorEmbed.create_error_embed(*handler(error))
 
 
 # Instantiate the bot with all intents enabled
@@ -23,15 +23,22 @@ class ColoredFormatter(logging.Formatter):
         'SUCCESS': '\033[0;32m', # Green
     }
 
+    # Colored level names, built once rather than on every record
+    COLORED_LEVELNAMES = {
+        level_name: f"{color}{level_name}\033[0m"  # Reset after level name
+        for level_name, color in COLORS.items()
+    }
+
     def format(self, record: logging.LogRecord) -> str:
         level_name = record.levelname
 
-        # Apply color to the level name if it matches a defined color
-        if level_name in self.COLORS:
-            level_name_color = f"{self.COLORS[level_name]}{level_name}\033[0m"  # Reset after level name
-            record.levelname = level_name_color
-
-        return super().format(record)
+        # Apply color to the level name if it matches a defined color. The record is shared
+        # with every other handler (e.g. the file handler), so restore the plain name afterwards.
+        record.levelname = self.COLORED_LEVELNAMES.get(level_name, level_name)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = level_name
 
 def setup_logger(name: str, log_file: Optional[str] = None, level: int = logging.DEBUG,
                  timestamp_format: str = '%Y-%m-%d %H:%M:%S') -> logging.Logger:
@@ -77,7 +84,7 @@ def setup_logger(name: str, log_file: Optional[str] = None, level: int = logging
             file_handler.setFormatter(file_formatter)
             logger.addHandler(file_handler)
         except Exception as e:
-            logger.error(f"Failed to create file handler for logging: {e}")
+            logger.error("Failed to create file handler for logging: %s", e)
 
     return logger
 
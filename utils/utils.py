@@ -1,9 +1,26 @@
 import os
 import json
+import functools
 import logging
 from typing import Any, Dict, Tuple, Optional
 from disnake.ext import commands
-from jsonschema import validate, ValidationError
+from jsonschema import Draft7Validator, ValidationError
+
+
+@functools.cache
+def _get_bot_logger() -> logging.Logger:
+    """
+    Gets the bot's logger, shared by all managers.
+
+    Returns:
+        logging.Logger: The 'BOT' logger if it exists, otherwise the module logger.
+    """
+    if "BOT" in logging.Logger.manager.loggerDict:
+        return logging.getLogger("BOT")
+    else:
+        logger = logging.getLogger(__name__)
+        logger.warning("No logger named 'BOT' found. Using the default logger.")
+        return logger
 
 
 class CogManager:
@@ -21,44 +38,38 @@ class CogManager:
         """
         self.bot = bot
         self.path = os.path.join(os.getcwd(), path)
+        # Dotted import prefix for the cogs package, e.g. "cogs" or "bot.cogs"
+        self._module_prefix = os.path.normpath(path).replace(os.sep, ".").strip(".")
 
         # Set up the logger
-        self.logger = self._setup_logger()
+        self.logger = _get_bot_logger()
 
-        self.cogs: list[str] = []
+        self.cogs: set[str] = set()
         self.errors: Dict[str, Exception] = {}
 
-    def _setup_logger(self) -> logging.Logger:
-        """
-        Sets up the logger for the CogManager.
-
-        Returns:
-            logging.Logger: The logger instance.
+    def load_cogs(self) -> Tuple[set[str], Dict[str, Exception]]:
         """
-        if "BOT" in logging.Logger.manager.loggerDict:
-            return logging.getLogger("BOT")
-        else:
-            logger = logging.getLogger(__name__)
-            logger.warning("No logger named 'BOT' found. Using the default logger.")
-            return logger
-
-    def load_cogs(self) -> Tuple[list[str], Dict[str, Exception]]:
-        """
-        Loads all cogs from the specified path.
+        Loads all cogs from the specified path. Cogs that are already loaded are skipped,
+        so calling this again only loads newly added files.
 
         Returns:
-            Tuple[list[str], Dict[str, Exception]]: A tuple containing the list of loaded cogs and any loading errors.
+            Tuple[set[str], Dict[str, Exception]]: A tuple containing the set of loaded cog modules and any loading errors.
         """
-        for file in os.listdir(self.path):
-            if file.endswith(".py"):
-                if file == "__init__.py":
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                file = entry.name
+                # Skip non-Python files and private modules such as __init__.py
+                if not file.endswith(".py") or file.startswith("_") or not entry.is_file():
+                    continue
+                module_name = f"{self._module_prefix}.{file[:-3]}"
+                if module_name in self.bot.extensions:
                     continue
                 try:
-                    self.bot.load_extension(f"cogs.{file[:-3]}")
-                    self.cogs.append(file)
+                    self.bot.load_extension(module_name)
+                    self.cogs.add(module_name)
                 except Exception as e:
-                    self.errors[f"cogs.{file[:-3]}"] = e
-                    self.logger.error(f"Failed to load cog {file}: {e}")
+                    self.errors[module_name] = e
+                    self.logger.error("Failed to load cog %s: %s", file, e)
         return self.cogs, self.errors
 
 
@@ -75,6 +86,9 @@ class ConfigManager:
         "required": ["TOKEN"],
     }
 
+    # Compiled once and reused for every load
+    _VALIDATOR = Draft7Validator(CONFIG_SCHEMA)
+
     def __init__(self, bot: commands.InteractionBot | Any, *, path: str = "data"):
         """
         Initializes the ConfigManager with the bot instance and path for configuration.
@@ -88,52 +102,39 @@ class ConfigManager:
         self.config_file = os.path.join(self.path, "config.json")
 
         # Set up the logger
-        self.logger = self._setup_logger()
+        self.logger = _get_bot_logger()
 
         self.config: Dict[str, Any] = {}
 
         # Load the configuration
         self.load_configs()
 
-    def _setup_logger(self) -> logging.Logger:
-        """
-        Sets up the logger for the ConfigManager.
-
-        Returns:
-            logging.Logger: The logger instance.
-        """
-        if "BOT" in logging.Logger.manager.loggerDict:
-            return logging.getLogger("BOT")
-        else:
-            logger = logging.getLogger(__name__)
-            logger.warning("No logger named 'BOT' found. Using the default logger.")
-            return logger
-
     def load_configs(self) -> None:
         """
         Loads the configuration from a JSON file.
         """
         try:
             if not os.path.exists(self.config_file):
-                self.logger.error(f"Config file '{self.config_file}' not found.")
+                self.logger.error("Config file '%s' not found.", self.config_file)
                 return
 
-            with open(self.config_file, "r") as f:
+            # json detects the encoding itself when given bytes
+            with open(self.config_file, "rb") as f:
                 config_data = json.load(f)
 
             # Validate the configuration against the schema
-            validate(instance=config_data, schema=self.CONFIG_SCHEMA)
+            self._VALIDATOR.validate(config_data)
             self.config = config_data
             self.logger.info("Configuration loaded successfully.")
 
         except FileNotFoundError:
-            self.logger.error(f"Config file '{self.config_file}' not found.")
+            self.logger.error("Config file '%s' not found.", self.config_file)
         except json.JSONDecodeError:
             self.logger.error("Error decoding JSON from the config file.")
         except ValidationError as ve:
-            self.logger.error(f"Configuration validation error: {ve.message}")
+            self.logger.error("Configuration validation error: %s", ve.message)
         except Exception as e:
-            self.logger.error(f"An unexpected error occurred while loading config: {e}")
+            self.logger.error("An unexpected error occurred while loading config: %s", e)
 
     def get_token(self) -> Optional[str]:
         """